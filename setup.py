@@ -0,0 +1,32 @@
+"""Optional native build of the tree parser.
+
+All package metadata lives in pyproject.toml. Setting FORGE_TREE_CYTHON=1
+compiles the pure-Python parser with Cython into
+forge_tree.parser._tree_parser_impl_cy, for example:
+
+    pip install Cython
+    FORGE_TREE_CYTHON=1 pip install --no-build-isolation .
+
+Without it (or without Cython) the package stays pure Python.
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+ext_modules = []
+
+if os.environ.get("FORGE_TREE_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            Extension(
+                "forge_tree.parser._tree_parser_impl_cy",
+                ["src/forge_tree/parser/_tree_parser_impl.py"],
+            )
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
+setup(ext_modules=ext_modules)
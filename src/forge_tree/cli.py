@@ -6,13 +6,6 @@ from typing import Dict, Any, Optional
 
 import click
 from rich.console import Console
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TimeElapsedColumn,
-)
 from rich.panel import Panel
 from rich.text import Text
 
@@ -54,6 +47,15 @@ def main():
 def forge(input_file: Path, output: Path, force: bool, verbose: bool, var: tuple):
     """Forge a project structure from a text file."""
 
+    # Only forging shows a progress bar, so keep it off the validate path
+    from rich.progress import (
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        BarColumn,
+        TimeElapsedColumn,
+    )
+
     try:
         # Parse variables
         variables = {}
@@ -78,9 +80,11 @@ def forge(input_file: Path, output: Path, force: bool, verbose: bool, var: tuple
         structure = parser.parse(content)
         structure.variables.update(variables)
 
+        total_items = count_items(structure.items)
+
         if verbose:
             console.print(f"🌳 Root: {structure.root}", style="green")
-            console.print(f"📁 Items: {count_items(structure.items)}", style="blue")
+            console.print(f"📁 Items: {total_items}", style="blue")
 
         # Generate the project
         generator = FileGenerator(force_overwrite=force, verbose=verbose)
@@ -96,7 +100,6 @@ def forge(input_file: Path, output: Path, force: bool, verbose: bool, var: tuple
             console=console,
         ) as progress:
 
-            total_items = count_items(structure.items)
             task = progress.add_task("🏗️ Forging project...", total=total_items)
 
             generator.generate(
@@ -154,11 +157,14 @@ def validate(input_file: Path):
 
 
 def count_items(items) -> int:
-    """Recursively count total items in structure."""
-    count = len(items)
-    for item in items:
-        count += count_items(item.children)
-    return count
+    """Count total items in structure."""
+    total = 0
+    stack = list(items)
+    while stack:
+        item = stack.pop()
+        total += 1
+        stack.extend(item.children)
+    return total
 
 
 if __name__ == "__main__":
@@ -1,105 +1,355 @@
 """File and directory generation utilities."""
 
 import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, List, Dict
+from typing import TYPE_CHECKING, Optional, Callable, List, Dict, Tuple, Type, Union
 
 from rich.console import Console
-from jinja2 import Environment, BaseLoader, TemplateError
+from rich.markup import escape
 
-from ..parser.tree_parser import ProjectStructure, StructureItem, ItemType
+from ..parser.tree_parser import (
+    ProjectStructure,
+    ProjectStructureSoA,
+    StructureItem,
+    ItemType,
+    KIND_DIRECTORY,
+)
 from ..errors import ForgeTreeError
 
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+IO_BACKENDS = ("threaded", "uring")
+
+# Files sharing a parent directory are written through one directory fd
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd
+# Upper bound on files per thread pool task, so one large directory still
+# spreads across workers
+_FILES_PER_TASK = 64
+
 
 class FileGenerator:
     """Generates files and directories from ProjectStructure."""
 
-    def __init__(self, force_overwrite: bool = False, verbose: bool = False):
+    def __init__(
+        self,
+        force_overwrite: bool = False,
+        verbose: bool = False,
+        io_backend: str = "threaded",
+    ):
+        if io_backend not in IO_BACKENDS:
+            raise ForgeTreeError(
+                f"Unknown io_backend: {io_backend} (expected one of {', '.join(IO_BACKENDS)})"
+            )
+
         self.force_overwrite = force_overwrite
+        self.io_backend = io_backend
         self.verbose = verbose
         self.console = Console()
-        self.jinja_env = Environment(loader=BaseLoader())
+        # Created on first template render, see _get_jinja_env
+        self.jinja_env: Optional["Environment"] = None
+        self._template_cache: Dict[str, "Template"] = {}
+        # Jinja's TemplateError once the environment exists; catches nothing before
+        self._template_errors: Tuple[Type[Exception], ...] = ()
+        self._progress_lock = threading.Lock()
+        self._verbose_buf: List[str] = []
 
     def generate(
         self,
-        structure: ProjectStructure,
+        structure: Union[ProjectStructure, ProjectStructureSoA],
         output_path: Path,
         progress_callback: Optional[Callable] = None,
     ):
         """Generate the complete project structure."""
 
-        # Create root directory
-        root_path = output_path / structure.root
-        self._create_directory(root_path)
+        # Work with plain strings from here on; os functions accept them directly
+        root_path = os.path.join(os.fspath(output_path), structure.root)
+        self._verbose_buf = []
 
-        if self.verbose:
-            self.console.print(f"✅ Created {root_path}", style="green")
+        try:
+            self._create_directory(root_path, parents=True)
 
-        # Generate all items without double progress callback
-        self._generate_items(
-            structure.items, root_path, structure.variables, progress_callback
-        )
+            if self.verbose:
+                self._verbose_buf.append(
+                    f"[green]✅ Created {escape(root_path)}[/green]"
+                )
+
+            if isinstance(structure, ProjectStructureSoA):
+                dirs, files = self._flatten_soa(structure, root_path)
+            else:
+                dirs, files = self._flatten(
+                    structure.items, root_path, structure.variables
+                )
+            self._create_directories(dirs, progress_callback)
+            self._write_files(files, progress_callback)
+        finally:
+            # One render pass for the whole log, even if generation failed
+            if self.verbose and self._verbose_buf:
+                self.console.print("\n".join(self._verbose_buf))
+
+    def _create_directories(
+        self, dirs: Dict[str, int], progress_callback: Optional[Callable] = None
+    ):
+        """Create all directories, parents first.
 
-    def _generate_items(
+        dirs maps each path to the number of structure items naming it, so
+        progress advances once per item and not for implied parents.
+        """
+        # A parent path is a prefix of its children's, so it sorts first and
+        # every mkdir finds its parent already in place
+        for dir_path in sorted(dirs):
+            if progress_callback:
+                for _ in range(dirs[dir_path]):
+                    progress_callback()
+
+            self._create_directory(dir_path)
+
+            if self.verbose:
+                self._verbose_buf.append(
+                    f"[green]📁 Created {escape(dir_path)}[/green]"
+                )
+
+    def _write_files(
         self,
-        items: List[StructureItem],
-        base_path: Path,
-        variables: Dict,
+        files: List[Tuple[str, bytes]],
         progress_callback: Optional[Callable] = None,
     ):
-        """Recursively generate all items."""
+        """Write all files using the configured io_backend."""
+        writer = self._open_uring_writer() if self.io_backend == "uring" else None
+        if writer is not None:
+            with writer:
+                writer.write_files(
+                    files,
+                    self.force_overwrite,
+                    on_written=lambda path: self._report_file(path, progress_callback),
+                )
+            return
 
-        for item in items:
-            item_path = base_path / item.name
+        buckets: Dict[str, List[Tuple[str, bytes]]] = {}
+        for path, data in files:
+            buckets.setdefault(os.path.dirname(path), []).append((path, data))
 
-            # Update progress BEFORE processing, not during
-            if progress_callback:
+        # Files are independent once their directories exist, so write them
+        # concurrently; the GIL is released while the OS does the I/O
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._write_bucket,
+                    dir_path,
+                    bucket[start : start + _FILES_PER_TASK],
+                    progress_callback,
+                )
+                for dir_path, bucket in buckets.items()
+                for start in range(0, len(bucket), _FILES_PER_TASK)
+            ]
+            for future in futures:
+                future.result()
+
+    def _write_bucket(
+        self,
+        dir_path: str,
+        files: List[Tuple[str, bytes]],
+        progress_callback: Optional[Callable] = None,
+    ):
+        """Write files that share a parent directory and report progress."""
+        # Opening relative to the directory fd skips re-resolving the full path
+        dir_fd = (
+            os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+            if _DIR_FD_SUPPORTED
+            else None
+        )
+        try:
+            for path, data in files:
+                self._create_file(path, data, dir_fd)
+                self._report_file(path, progress_callback)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    def _report_file(self, path: str, progress_callback: Optional[Callable] = None):
+        """Report a written file to the progress callback and verbose log."""
+        if progress_callback:
+            with self._progress_lock:
                 progress_callback()
 
+        if self.verbose:
+            # list.append is atomic, so worker threads can share the buffer
+            self._verbose_buf.append(f"[blue]📄 Created {escape(path)}[/blue]")
+
+    def _open_uring_writer(self):
+        """Set up an io_uring writer, or None to fall back to threads."""
+        try:
+            from .backends.uring_backend import UringWriter
+        except ImportError:  # liburing is optional and Linux-only
+            return None
+
+        try:
+            return UringWriter()
+        except OSError:
+            # Kernel without io_uring support, or blocked by a sandbox
+            return None
+
+    def _flatten(
+        self,
+        items: List[StructureItem],
+        base_path: str,
+        variables: Dict,
+    ) -> Tuple[Dict[str, int], List[Tuple[str, bytes]]]:
+        """Flatten the item tree into directory paths and encoded files."""
+        dirs: Dict[str, int] = {}
+        files: List[Tuple[str, bytes]] = []
+
+        # Reversed so the explicit stack pops items in tree order
+        stack = [(item, base_path) for item in reversed(items)]
+        while stack:
+            item, parent_path = stack.pop()
+            item_path = os.path.join(parent_path, item.name)
+
             if item.item_type == ItemType.DIRECTORY:
-                self._create_directory(item_path)
+                self._add_directory(dirs, item_path, base_path)
+                dirs[item_path] += 1
+                stack.extend((child, item_path) for child in reversed(item.children))
+            else:  # FILE
+                # Names like "src/main.py" need their intermediate directories
+                self._add_directory(dirs, os.path.dirname(item_path), base_path)
+                if not item.template and not item.content:
+                    data = b""
+                else:
+                    data = self._render_content(
+                        item.name, item.template, item.content, variables
+                    ).encode("utf-8")
+                files.append((item_path, data))
+
+        return dirs, files
 
-                if self.verbose:
-                    self.console.print(f"📁 Created {item_path}", style="green")
+    def _flatten_soa(
+        self, structure: ProjectStructureSoA, base_path: str
+    ) -> Tuple[Dict[str, int], List[Tuple[str, bytes]]]:
+        """Flatten a struct-of-arrays structure into directories and files."""
+        dirs: Dict[str, int] = {}
+        files: List[Tuple[str, bytes]] = []
+        paths: List[str] = []
 
-                # Recursively generate children WITHOUT passing progress_callback
-                if item.children:
-                    self._generate_items(
-                        item.children, item_path, variables, progress_callback
-                    )
+        # Parents precede their children, so a single forward pass is enough
+        for idx, name in enumerate(structure.names):
+            parent = structure.parents[idx]
+            item_path = os.path.join(base_path if parent < 0 else paths[parent], name)
+            paths.append(item_path)
 
+            if structure.kinds[idx] == KIND_DIRECTORY:
+                self._add_directory(dirs, item_path, base_path)
+                dirs[item_path] += 1
             else:  # FILE
-                content = self._render_content(item, variables)
-                self._create_file(item_path, content)
+                # Names like "src/main.py" need their intermediate directories
+                self._add_directory(dirs, os.path.dirname(item_path), base_path)
+                template_source = structure.templates[idx]
+                content = structure.contents[idx]
+                if not template_source and not content:
+                    data = b""
+                else:
+                    data = self._render_content(
+                        name, template_source, content, structure.variables
+                    ).encode("utf-8")
+                files.append((item_path, data))
+
+        return dirs, files
 
-                if self.verbose:
-                    self.console.print(f"📄 Created {item_path}", style="blue")
+    def _add_directory(self, dirs: Dict[str, int], path: str, base_path: str):
+        """Record a directory and any ancestors missing below base_path."""
+        while path != base_path and path not in dirs:
+            dirs[path] = 0
+            path = os.path.dirname(path)
 
-    def _create_directory(self, path: Path):
+    def _create_directory(self, path: str, parents: bool = False):
         """Create a directory."""
-        if path.exists() and not path.is_dir():
-            raise ForgeTreeError(f"Path exists but is not a directory: {path}")
+        # One stat answers both "does it exist" and "is it a directory"
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISDIR(st.st_mode):
+                raise ForgeTreeError(f"Path exists but is not a directory: {path}")
+            return
 
-        path.mkdir(parents=True, exist_ok=True)
+        if parents:
+            os.makedirs(path, exist_ok=True)
+        else:
+            os.mkdir(path)
 
-    def _create_file(self, path: Path, content: str):
-        """Create a file with content."""
-        if path.exists() and not self.force_overwrite:
-            raise ForgeTreeError(f"File already exists: {path}")
+    def _create_file(self, path: str, data: bytes, dir_fd: Optional[int] = None):
+        """Create a file with already encoded content.
+
+        With dir_fd, the file is opened relative to that directory, which
+        must be the parent of path.
+        """
+        # O_EXCL makes the existence check part of the open itself
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        if not self.force_overwrite:
+            flags |= os.O_EXCL
 
-        # Ensure parent directory exists
-        path.parent.mkdir(parents=True, exist_ok=True)
+        target = path if dir_fd is None else os.path.basename(path)
+        try:
+            fd = os.open(target, flags, 0o666, dir_fd=dir_fd)
+        except FileExistsError:
+            raise ForgeTreeError(f"File already exists: {path}")
+        except OSError as e:
+            # Relative to dir_fd the OS error only names the basename
+            raise ForgeTreeError(f"Failed to write {path}: {e.strerror}")
 
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        try:
+            # Empty placeholders only need the create
+            if data:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+        except OSError as e:
+            raise ForgeTreeError(f"Failed to write {path}: {e.strerror}")
+        finally:
+            os.close(fd)
 
-    def _render_content(self, item: StructureItem, variables: Dict) -> str:
+    def _render_content(
+        self,
+        name: str,
+        template_source: Optional[str],
+        content: Optional[str],
+        variables: Dict,
+    ) -> str:
         """Render template content with variables."""
-        if item.template:
+        if template_source:
+            # Static text has nothing for Jinja to do
+            if (
+                "{{" not in template_source
+                and "{%" not in template_source
+                and "{#" not in template_source
+            ):
+                # Mirror Jinja's newline normalisation and trailing newline removal
+                text = template_source
+                if "\r" in text:
+                    text = text.replace("\r\n", "\n").replace("\r", "\n")
+                return text[:-1] if text.endswith("\n") else text
+
             try:
-                template = self.jinja_env.from_string(item.template)
+                template = self._template_cache.get(template_source)
+                if template is None:
+                    template = self._get_jinja_env().from_string(template_source)
+                    self._template_cache[template_source] = template
                 return template.render(**variables)
-            except TemplateError as e:
-                raise ForgeTreeError(f"Template error in {item.name}: {e}")
+            except self._template_errors as e:
+                raise ForgeTreeError(f"Template error in {name}: {e}")
+
+        return content or ""
+
+    def _get_jinja_env(self) -> "Environment":
+        """Return the Jinja environment, creating it on first use."""
+        if self.jinja_env is None:
+            # Imported lazily so runs without templates never load Jinja
+            from jinja2 import Environment, BaseLoader, TemplateError
 
-        return item.content or ""
+            self.jinja_env = Environment(loader=BaseLoader())
+            self._template_errors = (TemplateError,)
+        return self.jinja_env
@@ -0,0 +1,8 @@
+"""Stand-in for the ``cython`` module when Cython is not installed.
+
+Only the names used in local variable annotations are provided; those
+annotations are never evaluated by the Python interpreter.
+"""
+
+int = int
+Py_ssize_t = int
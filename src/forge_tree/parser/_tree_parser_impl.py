@@ -0,0 +1,304 @@
+"""Pure-Python tree parser implementation.
+
+This module is also compiled with Cython into ``_tree_parser_impl_cy`` when
+the package is built with ``FORGE_TREE_CYTHON=1``; the local variable
+annotations using ``cython`` types are honoured there and ignored here.
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Literal, Optional, Tuple, Union, overload
+from enum import Enum
+
+from ..errors import ForgeTreeError
+
+try:
+    import cython
+except ImportError:  # Cython is only needed to build the compiled parser
+    from . import _cython_shim as cython  # type: ignore[no-redef]
+
+# One instance is created per tree line, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class ItemType(Enum):
+    """Type of structure item."""
+
+    FILE = "file"
+    DIRECTORY = "directory"
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class StructureItem:
+    """Represents a file or directory in the project structure."""
+
+    name: str
+    item_type: ItemType
+    children: List["StructureItem"] = field(default_factory=list)
+    template: Optional[str] = None
+    content: Optional[str] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ProjectStructure:
+    """Represents a complete project structure."""
+
+    root: str
+    items: List[StructureItem] = field(default_factory=list)
+    variables: Dict[str, Any] = field(default_factory=dict)
+
+
+# Values stored in ProjectStructureSoA.kinds
+KIND_FILE = 0
+KIND_DIRECTORY = 1
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ProjectStructureSoA:
+    """Represents a complete project structure as parallel arrays.
+
+    Item ``i`` is described by ``names[i]``, ``kinds[i]``, ``parents[i]``
+    (-1 for top-level items), ``templates[i]``, ``contents[i]`` and
+    ``children[i]``. Items are stored in tree order, so a parent always
+    comes before its children.
+    """
+
+    root: str
+    names: List[str] = field(default_factory=list)
+    kinds: bytearray = field(default_factory=bytearray)
+    parents: "array[int]" = field(default_factory=lambda: array("i"))
+    templates: List[Optional[str]] = field(default_factory=list)
+    contents: List[Optional[str]] = field(default_factory=list)
+    children: List[List[int]] = field(default_factory=list)
+    variables: Dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class TreeParser:
+    """Parses ASCII tree structures into ProjectStructure objects."""
+
+    def __init__(self):
+        self._indent_chars = " \t│├└─"
+        self._strip_table = str.maketrans("", "", "│├└─ \t")
+
+    @overload
+    def parse(
+        self, content: str, use_soa: Literal[False] = False
+    ) -> ProjectStructure: ...
+
+    @overload
+    def parse(self, content: str, use_soa: Literal[True]) -> ProjectStructureSoA: ...
+
+    def parse(
+        self, content: str, use_soa: bool = False
+    ) -> Union[ProjectStructure, ProjectStructureSoA]:
+        """Parse text content into a ProjectStructure.
+
+        With use_soa=True a ProjectStructureSoA is built directly instead,
+        which avoids one StructureItem per line for very large trees.
+        """
+        lines = [line.rstrip() for line in content.splitlines() if line.strip()]
+
+        if not lines:
+            raise ForgeTreeError("Empty input")
+
+        root_name = self._extract_root_name(lines[0])
+
+        body = lines[1:]
+        if body:
+            # Without box characters depth is purely indentation, which the
+            # specialised scan handles without any tree-character stripping
+            if any(char in content for char in "│├└─"):
+                entries = self._preprocess(body)
+            else:
+                entries = self._preprocess_plain(lines[0], body)
+
+        if use_soa:
+            structure = ProjectStructureSoA(root=root_name)
+            if body:
+                self._build_soa(body, entries, structure)
+            return structure
+
+        if body:
+            items, _ = self._parse_structure(body, entries, 0, 1)
+        else:
+            items = []
+
+        return ProjectStructure(root=root_name, items=items)
+
+    def _extract_root_name(self, line: str) -> str:
+        """Extract the root directory name from the first line."""
+        name = line.strip().rstrip("/")
+        if not name:
+            raise ForgeTreeError("Invalid root directory name")
+        return name
+
+    def _preprocess(self, lines: List[str]) -> List[Tuple[int, str, bool]]:
+        """Scan each line once into (depth, name, is_directory) entries."""
+        entries: List[Tuple[int, str, bool]] = []
+
+        depth: cython.int
+
+        for line in lines:
+            # Split off the indent prefix and count its depth characters
+            tail = line.lstrip(self._indent_chars)
+            prefix = line[: len(line) - len(tail)]
+            depth = prefix.count("├") + prefix.count("└") + prefix.count("│")
+
+            # Remove remaining tree characters and get content
+            content = tail.translate(self._strip_table).strip()
+
+            if not content:
+                raise ForgeTreeError(f"Empty name in line: {line}")
+
+            # Determine if it's a directory
+            is_directory = content.endswith("/") or "." not in content
+            entries.append((depth, content.rstrip("/"), is_directory))
+
+        return entries
+
+    def _preprocess_plain(
+        self, root_line: str, lines: List[str]
+    ) -> List[Tuple[int, str, bool]]:
+        """Scan space/tab indented lines into (depth, name, is_directory) entries."""
+        # Indentation is measured relative to the root line, in units of the
+        # smallest indent step used anywhere in the tree
+        base = len(root_line) - len(root_line.lstrip(" \t"))
+        indent_char = root_line[0] if base else ""
+        indents: List[int] = []
+
+        for line in lines:
+            width = len(line) - len(line.lstrip(" \t"))
+            if width:
+                # A tab has no fixed width in spaces, so a tree must use one
+                if not indent_char:
+                    indent_char = line[0]
+                if line[:width].strip(indent_char):
+                    raise ForgeTreeError(
+                        f"Mixed tab and space indentation at line: {line}"
+                    )
+            indents.append(width - base)
+
+        unit = min((indent for indent in indents if indent > 0), default=1)
+
+        entries: List[Tuple[int, str, bool]] = []
+        depth: cython.int
+
+        for line, indent in zip(lines, indents):
+            if indent > 0:
+                if indent % unit:
+                    raise ForgeTreeError(f"Inconsistent indentation at line: {line}")
+                depth = indent // unit
+            else:
+                depth = 0
+            # Same whitespace removal as the box-character path
+            content = line.translate(self._strip_table)
+
+            # Determine if it's a directory
+            is_directory = content.endswith("/") or "." not in content
+            entries.append((depth, content.rstrip("/"), is_directory))
+
+        return entries
+
+    def _parse_structure(
+        self,
+        lines: List[str],
+        entries: List[Tuple[int, str, bool]],
+        start_index: int,
+        current_depth: int,
+    ) -> Tuple[List[StructureItem], int]:
+        """Parse the structure lines into StructureItem objects with proper sibling handling."""
+        items: List[StructureItem] = []  # FIXED: Add explicit type annotation
+        i: cython.Py_ssize_t = start_index
+        depth: cython.int
+
+        while i < len(entries):
+            depth, name, is_directory = entries[i]
+
+            if depth < current_depth:
+                # We've returned to an ancestor level - stop parsing at this level
+                break
+            elif depth > current_depth:
+                # This line is deeper - it should be a child of the previous item
+                if not items:
+                    raise ForgeTreeError(f"Invalid tree structure at line: {lines[i]}")
+
+                # Recursively parse children and update the index
+                children, new_i = self._parse_structure(lines, entries, i, depth)
+                items[-1].children = children
+                items[-1].item_type = (
+                    ItemType.DIRECTORY
+                )  # Has children, must be directory
+                i = new_i
+            else:
+                # Same depth - this is a sibling
+                item = StructureItem(
+                    name=name,
+                    item_type=ItemType.DIRECTORY if is_directory else ItemType.FILE,
+                )
+                items.append(item)
+                i += 1
+
+        return items, i
+
+    def _build_soa(
+        self,
+        lines: List[str],
+        entries: List[Tuple[int, str, bool]],
+        structure: ProjectStructureSoA,
+    ):
+        """Fill structure from entries, with the same nesting as _parse_structure."""
+        names = structure.names
+        kinds = structure.kinds
+        parents = structure.parents
+        children = structure.children
+
+        # Open levels as [depth, parent index, index of the last item added]
+        levels: List[List[int]] = [[1, -1, -1]]
+        i: cython.Py_ssize_t
+        depth: cython.int
+
+        for i in range(len(entries)):
+            depth, name, is_directory = entries[i]
+
+            # Return to an ancestor level; leaving the top level ends the tree
+            while levels and depth < levels[-1][0]:
+                levels.pop()
+            if not levels:
+                break
+
+            level = levels[-1]
+            if depth > level[0]:
+                # This line is deeper - it should be a child of the previous item
+                parent = level[2]
+                if parent < 0:
+                    raise ForgeTreeError(f"Invalid tree structure at line: {lines[i]}")
+
+                # A new child level replaces any children parsed earlier, which
+                # are exactly the items stored after the parent
+                del names[parent + 1 :]
+                del kinds[parent + 1 :]
+                del parents[parent + 1 :]
+                del structure.templates[parent + 1 :]
+                del structure.contents[parent + 1 :]
+                del children[parent + 1 :]
+                children[parent] = []
+
+                kinds[parent] = KIND_DIRECTORY  # Has children, must be directory
+                level = [depth, parent, -1]
+                levels.append(level)
+
+            index = len(names)
+            names.append(name)
+            kinds.append(KIND_DIRECTORY if is_directory else KIND_FILE)
+            parents.append(level[1])
+            structure.templates.append(None)
+            structure.contents.append(None)
+            children.append([])
+            if level[1] >= 0:
+                children[level[1]].append(index)
+            level[2] = index
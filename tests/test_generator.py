@@ -0,0 +1,203 @@
+"""Tests for the file generator."""
+
+import pytest
+from forge_tree.parser.tree_parser import (
+    TreeParser,
+    ProjectStructure,
+    StructureItem,
+    ItemType,
+)
+from forge_tree.generator.file_generator import FileGenerator
+from forge_tree.errors import ForgeTreeError
+
+
+def make_structure():
+    """Build a small nested structure."""
+    return ProjectStructure(
+        root="my-app",
+        items=[
+            StructureItem(
+                name="src",
+                item_type=ItemType.DIRECTORY,
+                children=[
+                    StructureItem(name="main.py", item_type=ItemType.FILE),
+                    StructureItem(
+                        name="utils",
+                        item_type=ItemType.DIRECTORY,
+                        children=[
+                            StructureItem(
+                                name="helpers.py",
+                                item_type=ItemType.FILE,
+                                template="# {{ name }}",
+                            )
+                        ],
+                    ),
+                ],
+            ),
+            StructureItem(name="lib/core.py", item_type=ItemType.FILE),
+            StructureItem(name="README.md", item_type=ItemType.FILE, content="hi"),
+        ],
+        variables={"name": "helpers"},
+    )
+
+
+def test_generate_structure(tmp_path):
+    """Test generating nested directories and files."""
+    calls = []
+    FileGenerator().generate(
+        make_structure(), tmp_path, progress_callback=lambda: calls.append(1)
+    )
+
+    root = tmp_path / "my-app"
+    assert (root / "src" / "main.py").read_text() == ""
+    assert (root / "src" / "utils" / "helpers.py").read_text() == "# helpers"
+    assert (root / "lib" / "core.py").is_file()
+    assert (root / "README.md").read_text() == "hi"
+    assert len(calls) == 6
+
+
+def test_content_set_after_parse(tmp_path):
+    """Test that content and templates assigned after parsing are written."""
+    structure = TreeParser().parse("app/\n├── README.md\n└── main.py")
+    structure.items[0].content = "hello"
+    structure.items[1].template = "print({{ x }})"
+    structure.variables = {"x": 1}
+
+    FileGenerator().generate(structure, tmp_path)
+
+    assert (tmp_path / "app" / "README.md").read_text() == "hello"
+    assert (tmp_path / "app" / "main.py").read_text() == "print(1)"
+
+
+def test_existing_file_requires_force(tmp_path):
+    """Test that existing files are only overwritten with force."""
+    FileGenerator().generate(make_structure(), tmp_path)
+
+    with pytest.raises(ForgeTreeError):
+        FileGenerator().generate(make_structure(), tmp_path)
+
+    FileGenerator(force_overwrite=True).generate(make_structure(), tmp_path)
+
+
+def test_write_error_names_full_path(tmp_path):
+    """Test that a failed file write reports the full path."""
+    (tmp_path / "my-app" / "src" / "main.py").mkdir(parents=True)
+
+    with pytest.raises(ForgeTreeError) as excinfo:
+        FileGenerator(force_overwrite=True).generate(make_structure(), tmp_path)
+
+    assert str(tmp_path / "my-app" / "src" / "main.py") in str(excinfo.value)
+
+
+@pytest.mark.parametrize("io_backend", ["threaded", "uring"])
+def test_io_backends(tmp_path, io_backend):
+    """Test that every io_backend (or its fallback) writes the same tree."""
+    generator = FileGenerator(io_backend=io_backend)
+    generator.generate(make_structure(), tmp_path)
+
+    root = tmp_path / "my-app"
+    assert (root / "src" / "utils" / "helpers.py").read_text() == "# helpers"
+
+    with pytest.raises(ForgeTreeError):
+        generator.generate(make_structure(), tmp_path)
+
+
+@pytest.mark.parametrize(
+    "template",
+    ["line one\r\nline two\n", "old mac\rline\n\n", "no newline", "\n"],
+)
+def test_static_template_matches_jinja(template):
+    """Test that static templates skip Jinja but render identically."""
+    from jinja2 import Environment, BaseLoader
+
+    expected = Environment(loader=BaseLoader()).from_string(template).render()
+    generator = FileGenerator()
+
+    assert generator._render_content("static.txt", template, None, {}) == expected
+    assert generator.jinja_env is None
+
+
+def test_template_error(tmp_path):
+    """Test that Jinja syntax errors are reported as ForgeTreeError."""
+    structure = ProjectStructure(
+        root="my-app",
+        items=[
+            StructureItem(name="bad.py", item_type=ItemType.FILE, template="{{ a b }}")
+        ],
+    )
+
+    with pytest.raises(ForgeTreeError, match="bad.py"):
+        FileGenerator().generate(structure, tmp_path)
+
+
+def test_uring_backend_batches(tmp_path):
+    """Test the io_uring writer itself across several batches."""
+    pytest.importorskip("liburing")
+
+    generator = FileGenerator(io_backend="uring")
+    writer = generator._open_uring_writer()
+    assert writer is not None
+    batch_size = writer.batch_size
+    writer.close()
+
+    count = batch_size * 2 + 1
+    structure = ProjectStructure(
+        root="many",
+        items=[
+            StructureItem(name=f"f{i}.txt", item_type=ItemType.FILE, content=str(i))
+            for i in range(count)
+        ],
+    )
+    calls = []
+    generator.generate(structure, tmp_path, progress_callback=lambda: calls.append(1))
+
+    assert len(calls) == count
+    assert (tmp_path / "many" / f"f{count - 1}.txt").read_text() == str(count - 1)
+
+    with pytest.raises(ForgeTreeError, match="File already exists"):
+        generator.generate(structure, tmp_path)
+
+
+def test_unknown_io_backend():
+    """Test that an unknown io_backend is rejected."""
+    with pytest.raises(ForgeTreeError):
+        FileGenerator(io_backend="carrier-pigeon")
+
+
+def test_file_in_place_of_directory(tmp_path):
+    """Test that a file blocking a directory path is reported."""
+    (tmp_path / "my-app").mkdir()
+    (tmp_path / "my-app" / "src").write_text("not a directory")
+
+    with pytest.raises(ForgeTreeError):
+        FileGenerator().generate(make_structure(), tmp_path)
+
+
+def test_generate_soa_structure(tmp_path):
+    """Test that both parse representations generate the same tree."""
+    content = """my-app/
+├── src/
+│   └── main.py
+├── lib/core.py
+└── README.md"""
+
+    parser = TreeParser()
+    calls = {"nested": [], "soa": []}
+    FileGenerator().generate(
+        parser.parse(content),
+        tmp_path / "nested",
+        progress_callback=lambda: calls["nested"].append(1),
+    )
+    FileGenerator().generate(
+        parser.parse(content, use_soa=True),
+        tmp_path / "soa",
+        progress_callback=lambda: calls["soa"].append(1),
+    )
+
+    def listing(path):
+        return sorted(p.relative_to(path).as_posix() for p in path.rglob("*"))
+
+    assert listing(tmp_path / "soa") == listing(tmp_path / "nested")
+    assert (tmp_path / "soa" / "my-app" / "lib" / "core.py").is_file()
+    # One tick per parsed item; the implied lib/ directory adds none
+    assert len(calls["soa"]) == len(calls["nested"]) == 4
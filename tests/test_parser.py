@@ -1,7 +1,13 @@
 """Tests for the tree parser."""
 
 import pytest
-from forge_tree.parser.tree_parser import TreeParser, ProjectStructure, ItemType
+from forge_tree.parser.tree_parser import (
+    TreeParser,
+    ProjectStructure,
+    ItemType,
+    KIND_FILE,
+    KIND_DIRECTORY,
+)
 from forge_tree.errors import ForgeTreeError
 
 
@@ -44,3 +50,65 @@ def test_empty_input():
 
     with pytest.raises(ForgeTreeError):
         parser.parse("")
+
+
+def test_soa_structure():
+    """Test parsing into the struct-of-arrays representation."""
+    content = """my-app/
+├── src/
+│   └── main.py
+└── README.md"""
+
+    parser = TreeParser()
+    structure = parser.parse(content, use_soa=True)
+
+    assert structure.root == "my-app"
+    assert structure.names == ["src", "main.py", "README.md"]
+    assert list(structure.kinds) == [KIND_DIRECTORY, KIND_FILE, KIND_FILE]
+    assert list(structure.parents) == [-1, 0, -1]
+    assert structure.children == [[1], [], []]
+
+
+def test_indented_structure():
+    """Test parsing a structure indented with spaces only."""
+    content = """my-app/
+    src/
+        main.py
+        utils/
+            helpers.py
+    README.md"""
+
+    parser = TreeParser()
+    structure = parser.parse(content)
+
+    assert [item.name for item in structure.items] == ["src", "README.md"]
+    src_item = structure.items[0]
+    assert [child.name for child in src_item.children] == ["main.py", "utils"]
+    assert src_item.children[1].children[0].name == "helpers.py"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "app/\n\tsrc/\n\t\tmain.py\n    README.md",
+        "app/\n    src/\n      main.py",
+    ],
+)
+def test_inconsistent_indentation(content):
+    """Test that mixed tabs and spaces or uneven indent steps are rejected."""
+    parser = TreeParser()
+
+    with pytest.raises(ForgeTreeError):
+        parser.parse(content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["app/\n└── my file.txt", "app/\n    my file.txt"],
+)
+def test_spaced_name(content):
+    """Test that both tree styles drop whitespace inside names alike."""
+    parser = TreeParser()
+    structure = parser.parse(content)
+
+    assert [item.name for item in structure.items] == ["myfile.txt"]